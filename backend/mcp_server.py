@@ -9,264 +9,56 @@ import json
 import logging
 import os
 import sys
-import subprocess
-import platform
+import signal
 import time
-import traceback
-import warnings
-from typing import Dict, List, Optional, Any, Union
-from pathlib import Path
-import socket
-import threading
+from typing import Dict, List, Any, Tuple
 import uuid
-from datetime import datetime
-from dataclasses import dataclass
+from datetime import datetime, timezone
+from dataclasses import dataclass, asdict
 
 # Standard library imports that should always be available
-import importlib
-import importlib.util
-import pkg_resources
-from importlib.metadata import version, PackageNotFoundError
-
-# Suppress warnings for optional imports
-warnings.filterwarnings("ignore", category=DeprecationWarning)
-
-# Optional imports with graceful fallbacks
-try:
-    import psutil
-    HAS_PSUTIL = True
-except ImportError:
-    HAS_PSUTIL = False
-    psutil = None
-
-try:
-    import requests
-    HAS_REQUESTS = True
-except ImportError:
-    HAS_REQUESTS = False
-    requests = None
-
-try:
-    import numpy as np
-    HAS_NUMPY = True
-except ImportError:
-    HAS_NUMPY = False
-    np = None
-
-try:
-    import GPUtil
-    HAS_GPUTIL = True
-except ImportError:
-    HAS_GPUTIL = False
-    GPUtil = None
-
-try:
-    import quantumrandom
-    HAS_QUANTUMRANDOM = True
-except ImportError:
-    HAS_QUANTUMRANDOM = False
-    quantumrandom = None
-
-try:
-    import qiskit
-    from qiskit.quantum_info import random_state
-    HAS_QISKIT = True
-except ImportError:
-    HAS_QISKIT = False
-    qiskit = None
-
-try:
-    import matplotlib.pyplot as plt
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
-    plt = None
-
-try:
-    import cv2
-    HAS_OPENCV = True
-except ImportError:
-    HAS_OPENCV = False
-    cv2 = None
-
-try:
-    import torch
-    HAS_TORCH = True
-except ImportError:
-    HAS_TORCH = False
-    torch = None
-
-try:
-    import tensorflow as tf
-    HAS_TENSORFLOW = True
-except ImportError:
-    HAS_TENSORFLOW = False
-    tf = None
-
-try:
-    import pandas as pd
-    HAS_PANDAS = True
-except ImportError:
-    HAS_PANDAS = False
-    pd = None
-
-try:
-    import scipy
-    HAS_SCIPY = True
-except ImportError:
-    HAS_SCIPY = False
-    scipy = None
-
-try:
-    import sklearn
-    HAS_SKLEARN = True
-except ImportError:
-    HAS_SKLEARN = False
-    sklearn = None
-
-try:
-    import joblib
-    HAS_JOBLIB = True
-except ImportError:
-    HAS_JOBLIB = False
-    joblib = None
-
-try:
-    import pickle
-    HAS_PICKLE = True
-except ImportError:
-    HAS_PICKLE = False
-    pickle = None
-
-try:
-    import jsonlines
-    HAS_JSONLINES = True
-except ImportError:
-    HAS_JSONLINES = False
-    jsonlines = None
-
-try:
-    import toml
-    HAS_TOML = True
-except ImportError:
-    try:
-        import tomllib as toml
-        HAS_TOML = True
-    except ImportError:
-        HAS_TOML = False
-        toml = None
-
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
-    yaml = None
-
-try:
-    from distutils import version as dist_version
-    HAS_DISTUTILS = True
-except ImportError:
-    HAS_DISTUTILS = False
-    dist_version = None
-
-try:
-    import virtualenv
-    HAS_VIRTUALENV = True
-except ImportError:
-    HAS_VIRTUALENV = False
-    virtualenv = None
-
-try:
-    import conda
-    HAS_CONDA = True
-except ImportError:
-    HAS_CONDA = False
-    conda = None
-
-try:
-    import poetry
-    HAS_POETRY = True
-except ImportError:
-    HAS_POETRY = False
-    poetry = None
-
-try:
-    import pipenv
-    HAS_PIPENV = True
-except ImportError:
-    HAS_PIPENV = False
-    pipenv = None
-
-try:
-    import pipdeptree
-    HAS_PIPDEPTREE = True
-except ImportError:
-    HAS_PIPDEPTREE = False
-    pipdeptree = None
-
-try:
-    import safety
-    HAS_SAFETY = True
-except ImportError:
-    HAS_SAFETY = False
-    safety = None
-
-try:
-    import bandit
-    HAS_BANDIT = True
-except ImportError:
-    HAS_BANDIT = False
-    bandit = None
-
-try:
-    import pylint
-    HAS_PYLINT = True
-except ImportError:
-    HAS_PYLINT = False
-    pylint = None
-
-try:
-    import black
-    HAS_BLACK = True
-except ImportError:
-    HAS_BLACK = False
-    black = None
-
-try:
-    import isort
-    HAS_ISORT = True
-except ImportError:
-    HAS_ISORT = False
-    isort = None
-
-try:
-    import flake8
-    HAS_FLAKE8 = True
-except ImportError:
-    HAS_FLAKE8 = False
-    flake8 = None
-
-try:
-    import profiling
-    HAS_PROFILING = True
-except ImportError:
-    HAS_PROFILING = False
-    profiling = None
-
-try:
-    import memory_profiler
-    HAS_MEMORY_PROFILER = True
-except ImportError:
-    HAS_MEMORY_PROFILER = False
-    memory_profiler = None
-
-try:
-    import line_profiler
-    HAS_LINE_PROFILER = True
-except ImportError:
-    HAS_LINE_PROFILER = False
-    line_profiler = None
+from functools import lru_cache
+from importlib.metadata import version, distributions, PackageNotFoundError
+
+# Lazy optional-dependency testers: truthy if the package is installed,
+# but nothing is imported until an attribute is actually accessed.
+from optionals import (
+    HAS_ORJSON,
+    HAS_UVLOOP,
+    HAS_PSUTIL,
+    HAS_REQUESTS,
+    HAS_NUMPY,
+    HAS_GPUTIL,
+    HAS_QUANTUMRANDOM,
+    HAS_QISKIT,
+    HAS_MATPLOTLIB,
+    HAS_OPENCV,
+    HAS_TORCH,
+    HAS_TENSORFLOW,
+    HAS_PANDAS,
+    HAS_SCIPY,
+    HAS_SKLEARN,
+    HAS_JOBLIB,
+    HAS_PICKLE,
+    HAS_JSONLINES,
+    HAS_TOML,
+    HAS_YAML,
+    HAS_DISTUTILS,
+    HAS_VIRTUALENV,
+    HAS_CONDA,
+    HAS_POETRY,
+    HAS_PIPENV,
+    HAS_PIPDEPTREE,
+    HAS_SAFETY,
+    HAS_BANDIT,
+    HAS_PYLINT,
+    HAS_BLACK,
+    HAS_ISORT,
+    HAS_FLAKE8,
+    HAS_PROFILING,
+    HAS_MEMORY_PROFILER,
+    HAS_LINE_PROFILER,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -275,128 +67,150 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Duplicate imports handling (these were imported multiple times in the original)
-try:
-    import jsonlines as jsonlines_alt
-    HAS_JSONLINES_ALT = True
-except ImportError:
-    HAS_JSONLINES_ALT = False
-    jsonlines_alt = None
-
-try:
-    import toml as toml_alt
-    HAS_TOML_ALT = True
-except ImportError:
-    HAS_TOML_ALT = False
-    toml_alt = None
-
-try:
-    from distutils import version as dist_version_alt
-    HAS_DISTUTILS_ALT = True
-except ImportError:
-    HAS_DISTUTILS_ALT = False
-    dist_version_alt = None
-
-try:
-    import virtualenv as virtualenv_alt
-    HAS_VIRTUALENV_ALT = True
-except ImportError:
-    HAS_VIRTUALENV_ALT = False
-    virtualenv_alt = None
-
-try:
-    import conda as conda_alt
-    HAS_CONDA_ALT = True
-except ImportError:
-    HAS_CONDA_ALT = False
-    conda_alt = None
-
-try:
-    import poetry as poetry_alt
-    HAS_POETRY_ALT = True
-except ImportError:
-    HAS_POETRY_ALT = False
-    poetry_alt = None
-
-try:
-    import pipenv as pipenv_alt
-    HAS_PIPENV_ALT = True
-except ImportError:
-    HAS_PIPENV_ALT = False
-    pipenv_alt = None
-
-try:
-    import pipdeptree as pipdeptree_alt
-    HAS_PIPDEPTREE_ALT = True
-except ImportError:
-    HAS_PIPDEPTREE_ALT = False
-    pipdeptree_alt = None
-
-try:
-    import safety as safety_alt
-    HAS_SAFETY_ALT = True
-except ImportError:
-    HAS_SAFETY_ALT = False
-    safety_alt = None
-
-try:
-    import bandit as bandit_alt
-    HAS_BANDIT_ALT = True
-except ImportError:
-    HAS_BANDIT_ALT = False
-    bandit_alt = None
-
-try:
-    import pylint as pylint_alt
-    HAS_PYLINT_ALT = True
-except ImportError:
-    HAS_PYLINT_ALT = False
-    pylint_alt = None
-
-try:
-    import black as black_alt
-    HAS_BLACK_ALT = True
-except ImportError:
-    HAS_BLACK_ALT = False
-    black_alt = None
-
-try:
-    import isort as isort_alt
-    HAS_ISORT_ALT = True
-except ImportError:
-    HAS_ISORT_ALT = False
-    isort_alt = None
-
-try:
-    import flake8 as flake8_alt
-    HAS_FLAKE8_ALT = True
-except ImportError:
-    HAS_FLAKE8_ALT = False
-    flake8_alt = None
-
-try:
-    import profiling as profiling_alt
-    HAS_PROFILING_ALT = True
-except ImportError:
-    HAS_PROFILING_ALT = False
-    profiling_alt = None
-
-try:
-    import memory_profiler as memory_profiler_alt
-    HAS_MEMORY_PROFILER_ALT = True
-except ImportError:
-    HAS_MEMORY_PROFILER_ALT = False
-    memory_profiler_alt = None
-
-try:
-    import line_profiler as line_profiler_alt
-    HAS_LINE_PROFILER_ALT = True
-except ImportError:
-    HAS_LINE_PROFILER_ALT = False
-    line_profiler_alt = None
-
-
-@dataclass
+# Route warnings through logging instead of silencing them globally;
+# noisy optional imports are suppressed locally in optionals.py
+logging.captureWarnings(True)
+
+# Maximum number of concurrent pip install subprocesses
+_INSTALL_CONCURRENCY = 4
+
+# Cap on how much subprocess output is kept per stream (1 MiB)
+_STREAM_LIMIT = 1 << 20
+
+# Filesystem root whose usage is reported; resolved once at import.
+# The trailing separator matters on Windows: "C:" alone would resolve to
+# the current directory on that drive rather than the drive root.
+_ROOT_PATH = "C:\\" if os.name == "nt" else "/"
+
+# Capability fields paired with their human-readable labels
+_CAP_LABELS = (
+    ("gpu_monitoring", "GPU Monitoring"),
+    ("quantum_random", "Quantum Random"),
+    ("quantum_computing", "Quantum Computing"),
+    ("image_processing", "Image Processing"),
+    ("machine_learning", "Machine Learning"),
+    ("deep_learning", "Deep Learning"),
+    ("data_analysis", "Data Analysis"),
+    ("visualization", "Visualization"),
+    ("profiling", "Profiling"),
+    ("code_quality", "Code Quality"),
+    ("package_management", "Package Management"),
+)
+
+# Suggested packages per capability: (capability attr, label, packages)
+_RECOMMENDATIONS = (
+    ("gpu_monitoring", "GPU Monitoring", ("GPUtil", "psutil")),
+    ("quantum_random", "Quantum Random", ("quantumrandom",)),
+    ("quantum_computing", "Quantum Computing", ("qiskit", "qiskit-aer")),
+    ("image_processing", "Image Processing", ("opencv-python", "Pillow")),
+    ("machine_learning", "Machine Learning", ("scikit-learn", "numpy", "pandas")),
+    ("deep_learning", "Deep Learning", ("torch", "tensorflow")),
+    ("data_analysis", "Data Analysis", ("pandas", "numpy", "scipy")),
+    ("visualization", "Visualization", ("matplotlib", "seaborn", "plotly")),
+    ("profiling", "Profiling", ("memory-profiler", "line-profiler", "py-spy")),
+    ("code_quality", "Code Quality", ("pylint", "black", "isort", "flake8", "bandit")),
+    ("package_management", "Package Management", ("poetry", "pipenv", "pipdeptree")),
+)
+
+# Distribution names reported by get_system_info, paired with their testers
+_PACKAGES_TO_CHECK = (
+    ("psutil", HAS_PSUTIL),
+    ("requests", HAS_REQUESTS),
+    ("numpy", HAS_NUMPY),
+    ("GPUtil", HAS_GPUTIL),
+    ("quantumrandom", HAS_QUANTUMRANDOM),
+    ("qiskit", HAS_QISKIT),
+    ("matplotlib", HAS_MATPLOTLIB),
+    ("opencv-python", HAS_OPENCV),
+    ("torch", HAS_TORCH),
+    ("tensorflow", HAS_TENSORFLOW),
+    ("pandas", HAS_PANDAS),
+    ("scipy", HAS_SCIPY),
+    ("scikit-learn", HAS_SKLEARN),
+    ("joblib", HAS_JOBLIB),
+    ("jsonlines", HAS_JSONLINES),
+    ("toml", HAS_TOML),
+    ("PyYAML", HAS_YAML),
+    ("virtualenv", HAS_VIRTUALENV),
+    ("conda", HAS_CONDA),
+    ("poetry", HAS_POETRY),
+    ("pipenv", HAS_PIPENV),
+    ("pipdeptree", HAS_PIPDEPTREE),
+    ("safety", HAS_SAFETY),
+    ("bandit", HAS_BANDIT),
+    ("pylint", HAS_PYLINT),
+    ("black", HAS_BLACK),
+    ("isort", HAS_ISORT),
+    ("flake8", HAS_FLAKE8),
+    ("profiling", HAS_PROFILING),
+    ("memory-profiler", HAS_MEMORY_PROFILER),
+    ("line-profiler", HAS_LINE_PROFILER),
+)
+
+
+# Distribution-name sets backing each capability. "All of" sets are
+# tested with issubset, "any of" sets with isdisjoint.
+_GPU_MONITORING_SET = frozenset({"gputil", "psutil"})
+_QUANTUM_RANDOM_SET = frozenset({"quantumrandom"})
+_QUANTUM_COMPUTING_SET = frozenset({"qiskit"})
+_IMAGE_PROCESSING_SET = frozenset({"opencv-python"})
+_MACHINE_LEARNING_SET = frozenset({"scikit-learn", "numpy"})
+_DEEP_LEARNING_SET = frozenset({"torch", "tensorflow"})
+_DATA_ANALYSIS_SET = frozenset({"pandas", "numpy"})
+_VISUALIZATION_SET = frozenset({"matplotlib"})
+_PROFILING_SET = frozenset({"profiling", "memory-profiler", "line-profiler"})
+_CODE_QUALITY_SET = frozenset({"pylint", "black", "isort", "flake8"})
+_PACKAGE_MANAGEMENT_SET = frozenset({"poetry", "pipenv", "pipdeptree"})
+
+
+@lru_cache(maxsize=None)
+def _installed_versions() -> Dict[str, str]:
+    """Normalized distribution name -> version, from a single metadata scan"""
+    return {
+        (dist.metadata["Name"] or "").lower().replace("_", "-"): dist.version
+        for dist in distributions()
+    }
+
+
+@lru_cache(maxsize=None)
+def _installed_packages() -> frozenset:
+    """Normalized names of all installed distributions"""
+    return frozenset(_installed_versions())
+
+
+# Interpreter version never changes for the process lifetime
+_PY_VERSION = sys.version
+
+
+@lru_cache(maxsize=None)
+def _platform_string() -> str:
+    """platform.platform() parses OS metadata; compute it once on demand"""
+    import platform
+    return platform.platform()
+
+
+@lru_cache(maxsize=None)
+def _pkg_version(name: str) -> str:
+    """Look up an installed package version once and cache the result"""
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an object for log output, preferring orjson when installed"""
+    if HAS_ORJSON:
+        import orjson
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            default=str
+        ).decode()
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+@dataclass(slots=True, frozen=True)
 class MCPCapabilities:
     """Available capabilities based on installed packages"""
     gpu_monitoring: bool = False
@@ -417,117 +231,81 @@ class MCPServer:
 
     def __init__(self):
         self.capabilities = self._detect_capabilities()
+        # Capabilities never change for the server's lifetime; cache the
+        # derived dict and formatted string instead of recomputing per call.
+        self._capabilities_dict = asdict(self.capabilities)
+        self._cap_str = self._format_capabilities()
         self.session_id = str(uuid.uuid4())
-        self.start_time = datetime.now()
+        # The start timestamp never changes; format it once. Duration math
+        # should use the monotonic clock, which is immune to clock jumps.
+        self.start_time_iso = datetime.now(timezone.utc).isoformat()
+        self._start_monotonic = time.monotonic()
+        # Core count never changes; filled in on the first psutil snapshot
+        self._cpu_count = None
         logger.info(f"MCP Server initialized with session ID: {self.session_id}")
-        logger.info(f"Available capabilities: {self._format_capabilities()}")
+        logger.info(f"Available capabilities: {self._cap_str}")
 
     def _detect_capabilities(self) -> MCPCapabilities:
         """Detect available capabilities based on installed packages"""
+        installed = _installed_packages()
         return MCPCapabilities(
-            gpu_monitoring=HAS_GPUTIL and HAS_PSUTIL,
-            quantum_random=HAS_QUANTUMRANDOM,
-            quantum_computing=HAS_QISKIT,
-            image_processing=HAS_OPENCV,
-            machine_learning=HAS_SKLEARN and HAS_NUMPY,
-            deep_learning=HAS_TORCH or HAS_TENSORFLOW,
-            data_analysis=HAS_PANDAS and HAS_NUMPY,
-            visualization=HAS_MATPLOTLIB,
-            profiling=HAS_PROFILING or HAS_MEMORY_PROFILER or HAS_LINE_PROFILER,
-            code_quality=HAS_PYLINT or HAS_BLACK or HAS_ISORT or HAS_FLAKE8,
-            package_management=HAS_POETRY or HAS_PIPENV or HAS_PIPDEPTREE
+            gpu_monitoring=_GPU_MONITORING_SET <= installed,
+            quantum_random=_QUANTUM_RANDOM_SET <= installed,
+            quantum_computing=_QUANTUM_COMPUTING_SET <= installed,
+            image_processing=_IMAGE_PROCESSING_SET <= installed,
+            machine_learning=_MACHINE_LEARNING_SET <= installed,
+            deep_learning=not installed.isdisjoint(_DEEP_LEARNING_SET),
+            data_analysis=_DATA_ANALYSIS_SET <= installed,
+            visualization=_VISUALIZATION_SET <= installed,
+            profiling=not installed.isdisjoint(_PROFILING_SET),
+            code_quality=not installed.isdisjoint(_CODE_QUALITY_SET),
+            package_management=not installed.isdisjoint(_PACKAGE_MANAGEMENT_SET)
         )
 
     def _format_capabilities(self) -> str:
         """Format capabilities for logging"""
-        caps = []
-        if self.capabilities.gpu_monitoring:
-            caps.append("GPU Monitoring")
-        if self.capabilities.quantum_random:
-            caps.append("Quantum Random")
-        if self.capabilities.quantum_computing:
-            caps.append("Quantum Computing")
-        if self.capabilities.image_processing:
-            caps.append("Image Processing")
-        if self.capabilities.machine_learning:
-            caps.append("Machine Learning")
-        if self.capabilities.deep_learning:
-            caps.append("Deep Learning")
-        if self.capabilities.data_analysis:
-            caps.append("Data Analysis")
-        if self.capabilities.visualization:
-            caps.append("Visualization")
-        if self.capabilities.profiling:
-            caps.append("Profiling")
-        if self.capabilities.code_quality:
-            caps.append("Code Quality")
-        if self.capabilities.package_management:
-            caps.append("Package Management")
-        
-        return ", ".join(caps) if caps else "Basic functionality only"
+        caps = ", ".join(
+            label for attr, label in _CAP_LABELS
+            if getattr(self.capabilities, attr)
+        )
+        return caps if caps else "Basic functionality only"
 
     async def get_system_info(self) -> Dict[str, Any]:
         """Get comprehensive system information"""
         info = {
             "session_id": self.session_id,
-            "start_time": self.start_time.isoformat(),
-            "platform": platform.platform(),
-            "python_version": sys.version,
-            "capabilities": self.capabilities.__dict__,
+            "start_time": self.start_time_iso,
+            "platform": _platform_string(),
+            "python_version": _PY_VERSION,
+            # Copy so callers mutating the info dict can't corrupt the
+            # server's cached capabilities
+            "capabilities": self._capabilities_dict.copy(),
             "installed_packages": {}
         }
 
-        # Add package versions for installed packages
-        packages_to_check = [
-            ("psutil", HAS_PSUTIL),
-            ("requests", HAS_REQUESTS),
-            ("numpy", HAS_NUMPY),
-            ("GPUtil", HAS_GPUTIL),
-            ("quantumrandom", HAS_QUANTUMRANDOM),
-            ("qiskit", HAS_QISKIT),
-            ("matplotlib", HAS_MATPLOTLIB),
-            ("opencv-python", HAS_OPENCV),
-            ("torch", HAS_TORCH),
-            ("tensorflow", HAS_TENSORFLOW),
-            ("pandas", HAS_PANDAS),
-            ("scipy", HAS_SCIPY),
-            ("scikit-learn", HAS_SKLEARN),
-            ("joblib", HAS_JOBLIB),
-            ("jsonlines", HAS_JSONLINES),
-            ("toml", HAS_TOML),
-            ("PyYAML", HAS_YAML),
-            ("virtualenv", HAS_VIRTUALENV),
-            ("conda", HAS_CONDA),
-            ("poetry", HAS_POETRY),
-            ("pipenv", HAS_PIPENV),
-            ("pipdeptree", HAS_PIPDEPTREE),
-            ("safety", HAS_SAFETY),
-            ("bandit", HAS_BANDIT),
-            ("pylint", HAS_PYLINT),
-            ("black", HAS_BLACK),
-            ("isort", HAS_ISORT),
-            ("flake8", HAS_FLAKE8),
-            ("profiling", HAS_PROFILING),
-            ("memory-profiler", HAS_MEMORY_PROFILER),
-            ("line-profiler", HAS_LINE_PROFILER),
-        ]
-
-        for package_name, is_available in packages_to_check:
+        # Add package versions for installed packages; one cached scan
+        # serves all 30 lookups
+        installed_versions = _installed_versions()
+        for package_name, is_available in _PACKAGES_TO_CHECK:
             if is_available:
-                try:
-                    info["installed_packages"][package_name] = version(package_name)
-                except PackageNotFoundError:
-                    info["installed_packages"][package_name] = "unknown"
+                info["installed_packages"][package_name] = installed_versions.get(
+                    package_name.lower().replace("_", "-"), "unknown"
+                )
 
         # Add system resources if psutil is available
         if HAS_PSUTIL:
             try:
+                import psutil
+                # One virtual_memory() snapshot serves both fields
+                vm = psutil.virtual_memory()
+                if self._cpu_count is None:
+                    self._cpu_count = psutil.cpu_count()
                 info["system_resources"] = {
-                    "cpu_percent": psutil.cpu_percent(),
-                    "memory_percent": psutil.virtual_memory().percent,
-                    "disk_usage": psutil.disk_usage('/').percent if os.name != 'nt' else psutil.disk_usage('C:').percent,
-                    "cpu_count": psutil.cpu_count(),
-                    "memory_total_gb": round(psutil.virtual_memory().total / (1024**3), 2)
+                    "cpu_percent": psutil.cpu_percent(interval=None),
+                    "memory_percent": vm.percent,
+                    "disk_usage": psutil.disk_usage(_ROOT_PATH).percent,
+                    "cpu_count": self._cpu_count,
+                    "memory_total_gb": round(vm.total / (1024**3), 2)
                 }
             except Exception as e:
                 logger.warning(f"Could not get system resources: {e}")
@@ -535,6 +313,7 @@ class MCPServer:
         # Add GPU info if available
         if HAS_GPUTIL:
             try:
+                import GPUtil
                 gpus = GPUtil.getGPUs()
                 info["gpus"] = [
                     {
@@ -552,100 +331,107 @@ class MCPServer:
 
         return info
 
-    async def install_missing_packages(self, packages: List[str]) -> Dict[str, str]:
-        """Install missing packages (production-safe implementation)"""
-        results = {}
-        
-        for package in packages:
+    async def _install_package(self, package: str, sem: asyncio.Semaphore) -> Tuple[str, str]:
+        """Install a single package under the shared concurrency limit"""
+        async with sem:
             try:
-                # Check if package is already installed
-                try:
-                    version(package)
-                    results[package] = "already_installed"
-                    continue
-                except PackageNotFoundError:
-                    pass
-
-                # Install package using subprocess
                 process = await asyncio.create_subprocess_exec(
                     sys.executable, "-m", "pip", "install", package,
                     stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
+                    stderr=asyncio.subprocess.PIPE,
+                    limit=_STREAM_LIMIT
+                )
+
+                stdout, stderr = await asyncio.gather(
+                    self._read_stream(process.stdout),
+                    self._read_stream(process.stderr)
                 )
-                
-                stdout, stderr = await process.communicate()
-                
+                await process.wait()
+
                 if process.returncode == 0:
-                    results[package] = "installed"
                     logger.info(f"Successfully installed {package}")
-                else:
-                    results[package] = f"failed: {stderr.decode()}"
-                    logger.error(f"Failed to install {package}: {stderr.decode()}")
-                    
+                    return package, "installed"
+
+                logger.error(f"Failed to install {package}: {stderr}")
+                return package, f"failed: {stderr}"
+
             except Exception as e:
-                results[package] = f"error: {str(e)}"
                 logger.error(f"Error installing {package}: {e}")
-        
+                return package, f"error: {str(e)}"
+
+    async def install_missing_packages(self, packages: List[str]) -> Dict[str, str]:
+        """Install missing packages (production-safe implementation)"""
+        results = {}
+
+        # Skip packages that are already installed
+        to_install = []
+        for package in packages:
+            if _pkg_version(package) != "unknown":
+                results[package] = "already_installed"
+            else:
+                to_install.append(package)
+
+        # Bounded concurrency: overlap downloads without hammering pip
+        sem = asyncio.Semaphore(_INSTALL_CONCURRENCY)
+        for package, status in await asyncio.gather(
+            *(self._install_package(package, sem) for package in to_install)
+        ):
+            results[package] = status
+
         return results
 
+    async def _read_stream(self, stream: asyncio.StreamReader) -> str:
+        """Drain a subprocess stream into a buffer capped at _STREAM_LIMIT"""
+        buf = bytearray()
+        while True:
+            chunk = await stream.read(65536)
+            if not chunk:
+                break
+            if len(buf) < _STREAM_LIMIT:
+                buf.extend(chunk[:_STREAM_LIMIT - len(buf)])
+        return bytes(buf).decode("utf-8", errors="replace")
+
+    async def _run_tool(self, name: str, argv: List[str]) -> Tuple[str, Dict[str, Any]]:
+        """Run one external tool and capture its output for reporting"""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=_STREAM_LIMIT
+            )
+            stdout, stderr = await asyncio.gather(
+                self._read_stream(process.stdout),
+                self._read_stream(process.stderr)
+            )
+            await process.wait()
+            return name, {
+                "exit_code": process.returncode,
+                "output": stdout,
+                "errors": stderr
+            }
+        except Exception as e:
+            return name, {"error": str(e)}
+
     async def run_code_quality_check(self, file_path: str) -> Dict[str, Any]:
         """Run code quality checks if tools are available"""
         results = {"file": file_path, "checks": {}}
-        
+
         if not os.path.exists(file_path):
             results["error"] = "File not found"
             return results
 
-        # Run pylint if available
+        # The tools are independent processes; run them concurrently
+        tasks = []
         if HAS_PYLINT:
-            try:
-                process = await asyncio.create_subprocess_exec(
-                    "pylint", file_path,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                stdout, stderr = await process.communicate()
-                results["checks"]["pylint"] = {
-                    "exit_code": process.returncode,
-                    "output": stdout.decode(),
-                    "errors": stderr.decode()
-                }
-            except Exception as e:
-                results["checks"]["pylint"] = {"error": str(e)}
-
-        # Run flake8 if available
+            tasks.append(self._run_tool("pylint", ["pylint", file_path]))
         if HAS_FLAKE8:
-            try:
-                process = await asyncio.create_subprocess_exec(
-                    "flake8", file_path,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                stdout, stderr = await process.communicate()
-                results["checks"]["flake8"] = {
-                    "exit_code": process.returncode,
-                    "output": stdout.decode(),
-                    "errors": stderr.decode()
-                }
-            except Exception as e:
-                results["checks"]["flake8"] = {"error": str(e)}
-
-        # Run bandit if available
+            tasks.append(self._run_tool("flake8", ["flake8", file_path]))
         if HAS_BANDIT:
-            try:
-                process = await asyncio.create_subprocess_exec(
-                    "bandit", "-f", "json", file_path,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                stdout, stderr = await process.communicate()
-                results["checks"]["bandit"] = {
-                    "exit_code": process.returncode,
-                    "output": stdout.decode(),
-                    "errors": stderr.decode()
-                }
-            except Exception as e:
-                results["checks"]["bandit"] = {"error": str(e)}
+            tasks.append(self._run_tool("bandit", ["bandit", "-f", "json", file_path]))
+
+        for name, check in await asyncio.gather(*tasks):
+            results["checks"][name] = check
 
         return results
 
@@ -657,92 +443,49 @@ class MCPServer:
             results["error"] = "File not found"
             return results
 
-        # Format with black if available
+        # black and isort are independent; run them concurrently
+        tasks = []
         if HAS_BLACK:
-            try:
-                process = await asyncio.create_subprocess_exec(
-                    "black", "--check", "--diff", file_path,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                stdout, stderr = await process.communicate()
-                results["formatters"]["black"] = {
-                    "exit_code": process.returncode,
-                    "output": stdout.decode(),
-                    "errors": stderr.decode()
-                }
-            except Exception as e:
-                results["formatters"]["black"] = {"error": str(e)}
-
-        # Sort imports with isort if available
+            tasks.append(self._run_tool("black", ["black", "--check", "--diff", file_path]))
         if HAS_ISORT:
-            try:
-                process = await asyncio.create_subprocess_exec(
-                    "isort", "--check-only", "--diff", file_path,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                stdout, stderr = await process.communicate()
-                results["formatters"]["isort"] = {
-                    "exit_code": process.returncode,
-                    "output": stdout.decode(),
-                    "errors": stderr.decode()
-                }
-            except Exception as e:
-                results["formatters"]["isort"] = {"error": str(e)}
+            tasks.append(self._run_tool("isort", ["isort", "--check-only", "--diff", file_path]))
+
+        for name, check in await asyncio.gather(*tasks):
+            results["formatters"][name] = check
 
         return results
 
     def get_missing_packages_recommendations(self) -> Dict[str, List[str]]:
         """Get recommendations for missing packages by category"""
-        recommendations = {}
-        
-        if not self.capabilities.gpu_monitoring:
-            recommendations["GPU Monitoring"] = ["GPUtil", "psutil"]
-        
-        if not self.capabilities.quantum_random:
-            recommendations["Quantum Random"] = ["quantumrandom"]
-            
-        if not self.capabilities.quantum_computing:
-            recommendations["Quantum Computing"] = ["qiskit", "qiskit-aer"]
-            
-        if not self.capabilities.image_processing:
-            recommendations["Image Processing"] = ["opencv-python", "Pillow"]
-            
-        if not self.capabilities.machine_learning:
-            recommendations["Machine Learning"] = ["scikit-learn", "numpy", "pandas"]
-            
-        if not self.capabilities.deep_learning:
-            recommendations["Deep Learning"] = ["torch", "tensorflow"]
-            
-        if not self.capabilities.data_analysis:
-            recommendations["Data Analysis"] = ["pandas", "numpy", "scipy"]
-            
-        if not self.capabilities.visualization:
-            recommendations["Visualization"] = ["matplotlib", "seaborn", "plotly"]
-            
-        if not self.capabilities.profiling:
-            recommendations["Profiling"] = ["memory-profiler", "line-profiler", "py-spy"]
-            
-        if not self.capabilities.code_quality:
-            recommendations["Code Quality"] = ["pylint", "black", "isort", "flake8", "bandit"]
-            
-        if not self.capabilities.package_management:
-            recommendations["Package Management"] = ["poetry", "pipenv", "pipdeptree"]
-        
-        return recommendations
+        return {
+            label: list(packages)
+            for attr, label, packages in _RECOMMENDATIONS
+            if not getattr(self.capabilities, attr)
+        }
 
 
 async def main():
     """Main entry point for the MCP server"""
     server = MCPServer()
-    
+
+    # Shutdown is signalled via an event so the loop can sit fully idle
+    # instead of waking up every second.
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            # Windows event loops don't support add_signal_handler
+            signal.signal(sig, lambda *_: stop.set())
+
     try:
         logger.info("Starting MCP Server...")
         
         # Get system info
         system_info = await server.get_system_info()
-        logger.info(f"System info collected: {json.dumps(system_info, indent=2, default=str)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"System info collected: {_dumps(system_info)}")
         
         # Show missing package recommendations
         recommendations = server.get_missing_packages_recommendations()
@@ -751,18 +494,21 @@ async def main():
             for category, packages in recommendations.items():
                 logger.info(f"  {category}: {', '.join(packages)}")
         
-        # Keep server running
+        # Keep server running until a shutdown signal arrives
         logger.info("MCP Server is running. Press Ctrl+C to stop.")
-        
-        while True:
-            await asyncio.sleep(1)
-            
-    except KeyboardInterrupt:
+
+        await stop.wait()
         logger.info("MCP Server stopped by user")
+
     except Exception as e:
+        import traceback
         logger.error(f"MCP Server error: {e}")
         logger.error(traceback.format_exc())
 
 
 if __name__ == "__main__":
+    # uvloop's C-level event loop speeds up subprocess and socket work
+    if HAS_UVLOOP:
+        import uvloop
+        uvloop.install()
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Lazy optional-dependency testers for Sovren AI.
+Availability checks use importlib.util.find_spec so heavyweight packages
+(torch, tensorflow, qiskit, ...) are never imported unless actually used.
+"""
+
+import importlib
+import importlib.util
+import warnings
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _module_available(name: str) -> bool:
+    """Check whether a module is importable without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyImportTester:
+    """Proxy for an optional module.
+
+    Truthy when the module is installed (cached find_spec lookup, no
+    import); attribute access imports the module on first use and then
+    delegates, so ``HAS_PSUTIL.cpu_percent()`` works like the real module.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __bool__(self) -> bool:
+        return _module_available(self._name)
+
+    def __getattr__(self, attr: str) -> object:
+        if self._module is None:
+            # Some optional packages warn on import; suppress only here
+            # so real DeprecationWarnings stay visible elsewhere.
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", DeprecationWarning)
+                self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        return f"LazyImportTester({self._name!r})"
+
+
+HAS_ORJSON = LazyImportTester("orjson")
+HAS_UVLOOP = LazyImportTester("uvloop")
+HAS_PSUTIL = LazyImportTester("psutil")
+HAS_REQUESTS = LazyImportTester("requests")
+HAS_NUMPY = LazyImportTester("numpy")
+HAS_GPUTIL = LazyImportTester("GPUtil")
+HAS_QUANTUMRANDOM = LazyImportTester("quantumrandom")
+HAS_QISKIT = LazyImportTester("qiskit")
+HAS_MATPLOTLIB = LazyImportTester("matplotlib")
+HAS_OPENCV = LazyImportTester("cv2")
+HAS_TORCH = LazyImportTester("torch")
+HAS_TENSORFLOW = LazyImportTester("tensorflow")
+HAS_PANDAS = LazyImportTester("pandas")
+HAS_SCIPY = LazyImportTester("scipy")
+HAS_SKLEARN = LazyImportTester("sklearn")
+HAS_JOBLIB = LazyImportTester("joblib")
+HAS_PICKLE = LazyImportTester("pickle")
+HAS_JSONLINES = LazyImportTester("jsonlines")
+HAS_TOML = LazyImportTester("toml")
+HAS_YAML = LazyImportTester("yaml")
+HAS_DISTUTILS = LazyImportTester("distutils.version")
+HAS_VIRTUALENV = LazyImportTester("virtualenv")
+HAS_CONDA = LazyImportTester("conda")
+HAS_POETRY = LazyImportTester("poetry")
+HAS_PIPENV = LazyImportTester("pipenv")
+HAS_PIPDEPTREE = LazyImportTester("pipdeptree")
+HAS_SAFETY = LazyImportTester("safety")
+HAS_BANDIT = LazyImportTester("bandit")
+HAS_PYLINT = LazyImportTester("pylint")
+HAS_BLACK = LazyImportTester("black")
+HAS_ISORT = LazyImportTester("isort")
+HAS_FLAKE8 = LazyImportTester("flake8")
+HAS_PROFILING = LazyImportTester("profiling")
+HAS_MEMORY_PROFILER = LazyImportTester("memory_profiler")
+HAS_LINE_PROFILER = LazyImportTester("line_profiler")